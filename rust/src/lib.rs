@@ -23,5 +23,5 @@ mod core {
     use super::error::{KoiParserSyntaxError, KoiParserUnexpectedInputError, KoiParserUnexpectedEofError, PyParseError};
     
     #[pymodule_export]
-    use super::writer::{PyNumberFormat, PyParamFormatSelector, PyWriter};
+    use super::writer::{PyFloatFormat, PyNumberFormat, PyParamFormatSelector, PyWriter};
 }
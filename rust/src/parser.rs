@@ -11,6 +11,7 @@ use std::sync::{Arc, Mutex};
 
 use crate::command::PyCommand;
 use crate::error::raise_parser_err;
+use koicore::command::{Command, Parameter, Value};
 use crate::io::PyIoWrapper;
 use crate::traceback::add_traceback;
 use koicore::parser::{ErrorInfo, FileInputSource, Parser, ParserConfig, TextInputSource};
@@ -103,6 +104,18 @@ impl TextInputSource for PyIoWrapper {
     }
 }
 
+/// Build the configuration for the inner parser.
+///
+/// The inner parser always runs with `preserve_indent` enabled so that the
+/// raw line content (including the `#` prefix of annotations) reaches the
+/// binding layer; trimming according to the requested configuration is
+/// applied afterwards in `PyParser::normalize_command`.
+fn inner_config(config: &PyParserConfig) -> ParserConfig {
+    let mut inner: ParserConfig = config.clone().into();
+    inner.preserve_indent = true;
+    inner
+}
+
 /// Python binding for the KoiLang parser
 ///
 /// This class provides a high-level interface for parsing KoiLang content
@@ -149,7 +162,7 @@ impl PyParser {
             let string_source = FileInputSource::new(text)?;
             let arc_input: Arc<Mutex<dyn TextInputSource + Send>> =
                 Arc::new(Mutex::new(string_source));
-            let parser = Parser::new(arc_input.clone(), config.clone().into());
+            let parser = Parser::new(arc_input.clone(), inner_config(&config));
             return Ok(Self {
                 config: config,
                 inner: parser,
@@ -163,7 +176,7 @@ impl PyParser {
                 Ok(file_source) => {
                     let arc_input: Arc<Mutex<dyn TextInputSource + Send>> =
                         Arc::new(Mutex::new(file_source));
-                    let parser = Parser::new(arc_input.clone(), config.clone().into());
+                    let parser = Parser::new(arc_input.clone(), inner_config(&config));
                     return Ok(Self {
                         config: config,
                         inner: parser,
@@ -179,7 +192,7 @@ impl PyParser {
         }
         let py_io_wrapper = PyIoWrapper::new(path_or_file)?;
         let arc_input: Arc<Mutex<dyn TextInputSource + Send>> = Arc::new(Mutex::new(py_io_wrapper));
-        let parser = Parser::new(arc_input.clone(), config.clone().into());
+        let parser = Parser::new(arc_input.clone(), inner_config(&config));
         Ok(Self {
             config: config,
             inner: parser,
@@ -197,7 +210,7 @@ impl PyParser {
     ///     IOError: If there are input/output errors
     pub fn next_command(&mut self, py: Python<'_>) -> PyResult<Option<PyCommand>> {
         match self.inner.next_command() {
-            Ok(Some(command)) => Ok(Some(PyCommand::from(command))),
+            Ok(Some(command)) => Ok(Some(PyCommand::from(self.normalize_command(command)))),
             Ok(None) => Ok(None),
             Err(parse_error) => {
                 if let ErrorInfo::IoError { error } = parse_error.error_info {
@@ -257,17 +270,15 @@ impl PyParser {
     ///     KoiParseError: If parsing fails during processing
     ///     Exception: If callback raises an exception
     pub fn process_with(&mut self, py: Python<'_>, callback: Bound<'_, PyAny>) -> PyResult<bool> {
-        let parser = &mut self.inner;
-
         // Check if callback is callable
         if !callback.is_callable() {
             return Err(PyValueError::new_err("Callback must be callable"));
         }
 
         loop {
-            match parser.next_command() {
+            match self.inner.next_command() {
                 Ok(Some(command)) => {
-                    let py_command = PyCommand::from(command);
+                    let py_command = PyCommand::from(self.normalize_command(command));
 
                     // Call the Python callback with the command
                     let result = callback.call1((py_command,))?;
@@ -301,3 +312,31 @@ impl PyParser {
         }
     }
 }
+
+impl PyParser {
+    /// Normalize text/annotation commands to the configured trimming behaviour.
+    ///
+    /// Since the inner parser always preserves the raw line content, annotation
+    /// commands keep their leading `#` characters here. When the user did not
+    /// request preserved indentation, surrounding whitespace is stripped.
+    fn normalize_command(&self, command: Command) -> Command {
+        if self.config.preserve_indent {
+            return command;
+        }
+        let is_text = match command.name() {
+            "@text" => true,
+            "@annotation" => false,
+            _ => return command,
+        };
+        if let Some(Parameter::Basic(Value::String(content))) = command.params().first() {
+            let trimmed = content.trim().to_string();
+            if is_text {
+                Command::new_text(trimmed)
+            } else {
+                Command::new_annotation(trimmed)
+            }
+        } else {
+            command
+        }
+    }
+}
@@ -14,6 +14,7 @@ use pyo3::{
     types::{PyAny, PyDict, PyType},
 };
 
+use koicore::command::Command;
 use koicore::writer::{
     FloatFormat, FormatterOptions, NumberFormat, ParamFormatSelector, Writer, WriterConfig,
 };
@@ -477,6 +478,59 @@ impl PyWriter {
             .map_err(|e| e.into())
     }
 
+    /// Write a batch of items in a single call
+    ///
+    /// Iterates on the Rust side, fast-pathing Command instances and plain
+    /// strings (written as text commands) without re-entering Python. Any
+    /// other item is sent back to Python by calling its `__kola_write__`
+    /// method with `(wrapper, level)` as arguments.
+    ///
+    /// Args:
+    ///     items: Iterable of Command objects, strings, or writer items
+    ///     wrapper: Object passed as the writer argument to `__kola_write__`
+    ///     level: Indentation level passed to `__kola_write__`
+    ///
+    /// Returns:
+    ///     None
+    ///
+    /// Raises:
+    ///     TypeError: If an item needs `__kola_write__` but has none
+    ///     ValueError: If writing fails
+    #[pyo3(signature = (items, wrapper=None, level=0))]
+    pub fn write_items(
+        slf: &Bound<'_, Self>,
+        items: Bound<'_, PyAny>,
+        wrapper: Option<Bound<'_, PyAny>>,
+        level: usize,
+    ) -> PyResult<()> {
+        for item in items.try_iter()? {
+            let item = item?;
+            if let Ok(cmd) = item.cast::<PyCommand>() {
+                // Hold the borrow only for the write itself so that
+                // __kola_write__ callbacks can re-enter this writer
+                slf.borrow_mut().writer.write_command(&cmd.borrow().inner)?;
+            } else if let Ok(text) = item.extract::<&str>() {
+                slf.borrow_mut()
+                    .writer
+                    .write_command(&Command::new_text(text))?;
+            } else {
+                // Match the Python-side write(): items without the hook are
+                // a TypeError, not an AttributeError
+                let Ok(kola_write) = item.getattr("__kola_write__") else {
+                    return Err(PyTypeError::new_err(format!(
+                        "Expected Command, str or WriterItemLike, got {}",
+                        item.get_type()
+                    )));
+                };
+                let target = wrapper
+                    .as_ref()
+                    .map_or_else(|| slf.as_any().clone(), Bound::clone);
+                kola_write.call1((target, level))?;
+            }
+        }
+        Ok(())
+    }
+
     /// Increase the indentation level by 1
     ///
     /// This affects subsequent command writes by adding one level of indentation.
@@ -491,6 +545,26 @@ impl PyWriter {
         self.writer.dec_indent();
     }
 
+    /// Adjust the indentation level by a signed delta in a single call
+    ///
+    /// Positive deltas increase and negative deltas decrease the level;
+    /// the level never goes below zero. Batching several adjustments into
+    /// one call avoids a Python-to-Rust crossing per step.
+    ///
+    /// Args:
+    ///     delta: Signed change to apply to the indentation level
+    pub fn adjust_indent(&mut self, delta: isize) {
+        if delta >= 0 {
+            for _ in 0..delta {
+                self.writer.inc_indent();
+            }
+        } else {
+            for _ in 0..-delta {
+                self.writer.dec_indent();
+            }
+        }
+    }
+
     /// Get the current indentation level
     ///
     /// Returns:
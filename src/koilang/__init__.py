@@ -3,6 +3,7 @@ from .core import (
     Parser,
     Writer,
     NumberFormat,
+    FloatFormat,
     ParamFormatSelector,
     TracebackEntry,
     KoiParserLineSource,
@@ -25,6 +26,7 @@ __all__ = [
     "KoiParserUnexpectedInputError",
     "KoiParserUnexpectedEofError",
     "NumberFormat",
+    "FloatFormat",
     "ParamFormatSelector",
     "Writer",
     "FormatterOptions",
@@ -10,7 +10,7 @@ manipulate, and generate KoiLang content.
 """
 
 from os import PathLike
-from typing import IO, Any, Callable, Optional, Union
+from typing import IO, Any, Callable, Iterable, Optional, Union
 
 from typing_extensions import Self
 
@@ -605,6 +605,26 @@ class NumberFormat:
     BINARY: NumberFormat
     """Binary format (e.g., 0b101010)"""
 
+# FloatFormat enum
+class FloatFormat:
+    """Float format options for command parameter formatting.
+
+    This enum defines the different formats that can be used when writing
+    floating point values to KoiLang files.
+    """
+
+    DEFAULT: FloatFormat
+    """Unset float format (default) - uses natural representation"""
+
+    DECIMAL: FloatFormat
+    """Decimal format (e.g., 3.14)"""
+
+    SCIENTIFIC: FloatFormat
+    """Scientific format (e.g., 3.14e0)"""
+
+    GENERAL: FloatFormat
+    """General format"""
+
 # ParamFormatSelector enum
 class ParamFormatSelector:
     """Selector for parameter format configuration.
@@ -738,6 +758,33 @@ class Writer:
         """
         ...
 
+    def write_items(
+        self,
+        items: Iterable[Any],
+        wrapper: Optional[Any] = None,
+        level: int = 0,
+    ) -> None:
+        """Write a batch of items in a single call.
+
+        Iterates on the Rust side, fast-pathing Command instances and plain
+        strings (written as text commands). Any other item is sent back to
+        Python by calling its `__kola_write__` method with `(wrapper, level)`
+        as arguments.
+
+        Args:
+            items: Iterable of Command objects, strings, or writer items
+            wrapper: Object passed as the writer argument to `__kola_write__`
+            level: Indentation level passed to `__kola_write__`
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: If an item needs `__kola_write__` but has none
+            ValueError: If writing fails
+        """
+        ...
+
     def inc_indent(self) -> None:
         """Increase the indentation level.
 
@@ -752,6 +799,18 @@ class Writer:
         """
         ...
 
+    def adjust_indent(self, delta: int) -> None:
+        """Adjust the indentation level by a signed delta in a single call.
+
+        Positive deltas increase and negative deltas decrease the level;
+        the level never goes below zero. Batching several adjustments into
+        one call avoids a Python-to-Rust crossing per step.
+
+        Args:
+            delta: Signed change to apply to the indentation level
+        """
+        ...
+
     def get_indent(self) -> int:
         """Get the current indentation level.
 
@@ -814,6 +873,7 @@ __all__ = [
     "KoiParserUnexpectedInputError",
     "KoiParserUnexpectedEofError",
     "NumberFormat",
+    "FloatFormat",
     "ParamFormatSelector",
     "Writer",
 ]
@@ -1,8 +1,8 @@
 from dataclasses import dataclass, field
-from koilang.core import NumberFormat
+from koilang.core import FloatFormat, NumberFormat
 
 
-@dataclass
+@dataclass(slots=True)
 class ParserConfig:
     """Configuration options for the KoiLang parser."""
 
@@ -10,9 +10,11 @@ class ParserConfig:
     skip_annotations: bool = False
     convert_number_command: bool = True
     skip_add_traceback: bool = False
+    preserve_empty_lines: bool = False
+    preserve_indent: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FormatterOptions:
     """Formatter options for the KoiLang writer."""
 
@@ -22,13 +24,14 @@ class FormatterOptions:
     newline_after: bool = False
     compact: bool = False
     force_quotes_for_vars: bool = False
-    number_format: NumberFormat = field(default_factory=lambda: NumberFormat.UNKNOWN)
+    number_format: NumberFormat = NumberFormat.UNKNOWN
     newline_before_param: bool = False
     newline_after_param: bool = False
+    float_format: FloatFormat = FloatFormat.DEFAULT
     should_override: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class WriterConfig:
     """Configuration options for the KoiLang writer."""
 
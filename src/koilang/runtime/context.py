@@ -1,4 +1,4 @@
-from contextvars import Context, ContextVar, copy_context
+from contextvars import Context, ContextVar
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from ..core import Command
@@ -36,12 +36,20 @@ def env_exit(env: Any) -> None:
 
 
 def wrap_handler(runtime: "Runtime", cmd: Command, handler: Callable[..., Any], context: Context | None = None) -> Any:
-    if not context:
-        context = copy_context()
-    
+    if context is None:
+        # Fast path: set the two vars in the current context instead of
+        # copying the whole context for a single handler call.
+        tok_rt = runtime_ctx.set(runtime)
+        tok_cmd = command_ctx.set(cmd)
+        try:
+            return handler(*cmd.args, **cmd.kwargs)
+        finally:
+            command_ctx.reset(tok_cmd)
+            runtime_ctx.reset(tok_rt)
+
     def inner() -> Any:
         runtime_ctx.set(runtime)
         command_ctx.set(cmd)
         return handler(*cmd.args, **cmd.kwargs)
-    
+
     return context.run(inner)
@@ -7,29 +7,42 @@ T = TypeVar("T")
 
 
 class _EnvProxy:
+    __slots__ = ["runtime", "env", "_wcache"]
+
     def __init__(self, runtime: Runtime, env: Any) -> None:
         self.runtime = runtime
         if env is self:
             raise ValueError("Environment cannot be self")
         self.env = env
+        self._wcache: dict[str, Any] = {}
 
     def __getattr__(self, name: str) -> Any:
+        # Cache built wrappers so repeat accesses are a single dict probe
+        try:
+            return self._wcache[name]
+        except KeyError:
+            pass
+
         method = getattr(self.env, name)
         if not name.startswith("do_") and not name.startswith("on_"):
             return method
         elif not callable(method):
             return method
 
+        cmd_name = self.runtime._get_command_name(name)
+
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            cmd_name = self.runtime._get_command_name(name)
             params = _build_params(args, kwargs)
             cmd = Command(cmd_name, params)
             return self.runtime._execute_on_env(self.env, name, cmd)
 
+        self._wcache[name] = wrapper
         return wrapper
 
 
 class Executor(Runtime):
+    __slots__ = []
+
     def __getattr__(self, name: str) -> Any:
         if name.startswith("do_") or name.startswith("on_"):
             def virtual_command(*args: Any, **kwargs: Any) -> Any:
@@ -47,43 +60,34 @@ class Executor(Runtime):
         else:
             env_type, index = key, None
 
-        # Find environment
-        target_env = None
-
-        # Searching logic
-        # If index is provided, we search for the Nth instance of that type.
-        # If index is None, we default to the *last* instance (top of stack) usually?
-        # Test says: `executor[TestCommandSet]` -> access implicit.
-        # Test says: `executor[TestEnv, 0]` -> first instance.
-        # Test says: `executor[TestCommandSet, -1]` -> last instance.
-
-        matches = [e for e in self.env_stack if isinstance(e, env_type)]
-
-        if not matches:
-            if index is not None:
-                raise KeyError(
-                    f"Environment of type {env_type} at index {index} not found"
-                )
-            # If not found and no index specified, fallback to using the type itself (e.g. for classmethods)
-            target_env = env_type
-
-        elif index is None:
-            # Default behavior not explicitly specified in snippet but implied 'current' or 'last' usually.
-            # In `executor[TestCommandSet]`, expected is likely the active one (last pushed).
-            target_env = matches[-1]
-        else:
+        if index is None:
+            # Default to the last (innermost) matching environment; fall back
+            # to the type itself when no instance is on the stack (e.g. for
+            # classmethods).
+            for env in reversed(self.env_stack):
+                if isinstance(env, env_type):
+                    return cast(T, _EnvProxy(self, env))
+            return cast(T, _EnvProxy(self, env_type))
+
+        if index < 0:
+            # Negative indexes need the full match list
+            matches = [e for e in self.env_stack if isinstance(e, env_type)]
             try:
-                target_env = matches[index]
+                return cast(T, _EnvProxy(self, matches[index]))
             except IndexError:
                 raise KeyError(
                     f"Environment of type {env_type} at index {index} not found"
                 )
 
-        return cast(T, _EnvProxy(self, target_env))
+        # Non-negative index: stop scanning once the Nth match is found
+        remaining = index
+        for env in self.env_stack:
+            if isinstance(env, env_type):
+                if not remaining:
+                    return cast(T, _EnvProxy(self, env))
+                remaining -= 1
+        raise KeyError(f"Environment of type {env_type} at index {index} not found")
 
 
 def _build_params(args: tuple[Any, ...], kwargs: dict[str, Any]) -> list[Any]:
-    params = list(args)
-    for k, v in kwargs.items():
-        params.append((k, v))
-    return params
+    return [*args, *kwargs.items()]
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import (
     IO,
     Any,
@@ -14,21 +15,120 @@ from .context import wrap_handler
 Middleware = Callable[["Runtime", Command, Callable[[], Any]], Any]
 
 
+# Bounded, unlike _command_name: the keys here are command names taken from
+# parsed documents, so an unbounded memo would intern every name ever seen
+# (including unknown ones) for the life of the process
+@lru_cache(maxsize=1024)
+def _method_name(cmd_name: str) -> str:
+    if cmd_name.startswith("@"):
+        return f"on_{cmd_name[1:]}"
+    return f"do_{cmd_name}"
+
+
+class _MiddlewareChain:
+    """Single-allocation continuation over a runtime's middleware list.
+
+    The chain object is passed to each middleware as its `next_handler`;
+    calling it advances to the next middleware and finally executes the
+    command, without allocating a closure per step.
+    """
+
+    __slots__ = ["runtime", "cmd", "index"]
+
+    def __init__(self, runtime: "Runtime", cmd: Command) -> None:
+        self.runtime = runtime
+        self.cmd = cmd
+        self.index = 0
+
+    def __call__(self) -> Any:
+        runtime = self.runtime
+        index = self.index
+        if index >= len(runtime.middleware):
+            return runtime._execute_command(self.cmd)
+        self.index = index + 1
+        try:
+            return runtime.middleware[index](runtime, self.cmd, self)
+        finally:
+            # Restore the position so a middleware calling next_handler()
+            # again (retry patterns) replays the downstream chain instead of
+            # skipping past it
+            self.index = index
+
+
+def _bind_handlers(env: Any) -> dict[str, Callable[..., Any]]:
+    """Bind all `do_`/`on_` handlers of an environment into a lookup table."""
+    return {
+        name: getattr(env, name)
+        for name in dir(env)
+        if name.startswith(("do_", "on_"))
+    }
+
+
+@lru_cache(maxsize=None)
+def _command_name(method_name: str) -> str:
+    if method_name.startswith("on_"):
+        return f"@{method_name[3:]}"
+    if method_name.startswith("do_"):
+        return method_name[3:]
+    return method_name
+
+
 class Runtime:
+    __slots__ = [
+        "env_stack",
+        "middleware",
+        "use_context",
+        "_current_command",
+        "_dispatch_impl",
+        "_handler_cache",
+        "_env_handlers",
+    ]
+
     def __init__(
-        self, root_env: Any, middleware: Optional[List[Middleware]] = None
+        self,
+        root_env: Any,
+        middleware: Optional[List[Middleware]] = None,
+        *,
+        use_context: bool = True,
     ) -> None:
+        """
+        :param root_env: the root environment of the runtime
+        :param middleware: optional middleware list wrapping command dispatch
+        :param use_context: whether to run handlers with the context vars set.
+            Disabling this skips the contextvar writes on every dispatch, but
+            `current_runtime()`/`current_command()` will not work inside
+            handlers; use the `current_command` attribute instead.
+        """
         self.env_stack: List[Any] = [root_env]
         self.middleware: List[Middleware] = middleware or []
+        self.use_context = use_context
         self._current_command: Optional[Command] = None
+        self._dispatch_impl = self._build_dispatch()
+        self._handler_cache: dict[str, Optional[Callable[..., Any]]] = {}
+        self._env_handlers: List[dict[str, Callable[..., Any]]] = [
+            _bind_handlers(root_env)
+        ]
+
+    @property
+    def current_command(self) -> Optional[Command]:
+        """The command currently being dispatched, if any.
+
+        Unlike `current_command()` from the context module, this works even
+        when the runtime was created with `use_context=False`.
+        """
+        return self._current_command
 
     def env_enter(self, env: Any) -> None:
         self.env_stack.append(env)
+        self._env_handlers.append(_bind_handlers(env))
+        self._handler_cache.clear()
 
     def env_exit(self, env: Any) -> None:
         if self.env_stack[-1] is not env:
             raise ValueError("Environment mismatch during exit")
         self.env_stack.pop()
+        self._env_handlers.pop()
+        self._handler_cache.clear()
 
     def execute(self, source: Union[str, IO[str]]) -> None:
         self._notify_lifecycle("on_start")
@@ -40,51 +140,57 @@ class Runtime:
             self._notify_lifecycle("on_end")
 
     def _notify_lifecycle(self, method_name: str) -> None:
-        for env in self.env_stack:
-            if hasattr(env, method_name):
-                getattr(env, method_name)()
+        for handlers in self._env_handlers:
+            fn = handlers.get(method_name)
+            if fn is not None:
+                fn()
 
-    def _dispatch(self, cmd: Command) -> Any:
-        """Dispatch command through middleware chain."""
+    def _build_dispatch(self) -> Callable[[Command], Any]:
+        """Select the dispatch implementation for the middleware list."""
         if not self.middleware:
-            return self._execute_command(cmd)
+            return self._execute_command
+        return self._dispatch_middleware
 
-        # Build the middleware chain using direct iteration
-        def execute_with_middleware(index: int) -> Any:
-            if index >= len(self.middleware):
-                return self._execute_command(cmd)
-            return self.middleware[index](
-                self, cmd, lambda: execute_with_middleware(index + 1)
-            )
+    def _dispatch_middleware(self, cmd: Command) -> Any:
+        return _MiddlewareChain(self, cmd)()
 
-        return execute_with_middleware(0)
+    def _dispatch(self, cmd: Command) -> Any:
+        """Dispatch command through the middleware chain."""
+        return self._dispatch_impl(cmd)
 
     def _get_method_name(self, cmd_name: str) -> str:
-        if cmd_name.startswith("@"):
-            return f"on_{cmd_name[1:]}"
-        return f"do_{cmd_name}"
+        return _method_name(cmd_name)
 
     def _get_command_name(self, method_name: str) -> str:
-        if method_name.startswith("on_"):
-            return f"@{method_name[3:]}"
-        if method_name.startswith("do_"):
-            return method_name[3:]
-        return method_name
+        return _command_name(method_name)
 
     def _execute_on_env(self, env: Any, method_name: str, cmd: Command) -> Any:
         handler_method = getattr(env, method_name)
+        if not self.use_context:
+            return handler_method(*cmd.args, **cmd.kwargs)
         return wrap_handler(self, cmd, handler_method)
 
+    def _resolve_handler(self, method_name: str) -> Optional[Callable[..., Any]]:
+        # Search for handler in the environment stack, from top to bottom
+        for handlers in reversed(self._env_handlers):
+            handler = handlers.get(method_name)
+            if handler is not None:
+                return handler
+        return None
+
     def _execute_command(self, cmd: Command) -> Any:
         self._current_command = cmd
         try:
-            method_name = self._get_method_name(cmd.name)
-
-            # Search for handler in the environment stack, from top to bottom
-            for env in reversed(self.env_stack):
-                if hasattr(env, method_name):
-                    return self._execute_on_env(env, method_name, cmd)
-
-            return None
+            method_name = _method_name(cmd.name)
+            try:
+                handler = self._handler_cache[method_name]
+            except KeyError:
+                handler = self._resolve_handler(method_name)
+                self._handler_cache[method_name] = handler
+            if handler is None:
+                return None
+            if not self.use_context:
+                return handler(*cmd.args, **cmd.kwargs)
+            return wrap_handler(self, cmd, handler)
         finally:
             self._current_command = None
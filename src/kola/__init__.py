@@ -16,15 +16,14 @@ from .klvm import (
 )
 from .version import __version__, __version_num__
 from .exception import KoiLangError, KoiLangSyntaxError, KoiLangCommandError
+# Map koilang.core classes to maintain original API
+from .parser import Parser
+from .writer import BaseWriter as Writer
 
 
 __author__ = "Ovizro"
 __author_email__ = "Ovizro@visecy.top"
 
-# Map koilang.core classes to maintain original API
-from .parser import Parser
-from .writer import BaseWriter as Writer
-
 __all__ = [
     "KoiLang",
     "Environment",
@@ -18,6 +18,7 @@ from argparse import ArgumentParser
 from traceback import print_exc
 
 from .exception import KoiLangError
+from .lexer import BaseLexer, FileLexer
 from .lib import load_library, main_class_from_module
 from .lib.debugger import KoiLangRunner, CommandDebugger
 
@@ -49,17 +50,16 @@ if __name__ == "__main__":
     namespace = parser.parse_args()
 
     encoding = namespace.encoding
-    content = None
-    
+    source = None
+
     if namespace.file:
-        # Read file content directly
-        with open(namespace.file, 'r', encoding=encoding) as f:
-            content = f.read()
+        # Stream the file through a lexer instead of reading it into memory
+        source = FileLexer(namespace.file, encoding=encoding)
     elif namespace.inline:
-        content = namespace.inline
+        source = namespace.inline
     elif not sys.stdin.isatty():
-        # Read from stdin directly
-        content = sys.stdin.read()
+        # Stream from stdin directly
+        source = BaseLexer(encoding=encoding)
 
     runner_type = "Runner"
     if namespace.debug == "token":
@@ -75,8 +75,8 @@ if __name__ == "__main__":
             command_cls = KoiLangRunner
 
         with command_cls().exec_block() as command_set:
-            if content:
-                command_set.parse(content)
+            if source is not None:
+                command_set.parse(source)
             else:
                 print(f"KoiLang {runner_type} {__version__} on Python {sys.version}")
                 while True:
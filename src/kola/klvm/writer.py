@@ -11,6 +11,11 @@ from .handler import AbstractHandler
 from .koilang import KoiLang
 
 
+@lru_cache(maxsize=None)
+def _cached_signature(func: Callable) -> Signature:
+    return signature(func)
+
+
 @lru_cache()
 def _default_writer_factory(name: str, sig: Optional[Signature] = None):
     def inner(writer: Writer, *args, **kwds) -> None:
@@ -100,6 +105,6 @@ class WriterHandler(AbstractHandler):
 
         if not writer_func:
             writer_func = _default_writer_factory(
-                command.__name__, signature(command.__func__)
+                command.__name__, _cached_signature(command.__func__)
             )
         return writer_func(self.owner._writer, *args, **kwargs)
@@ -1,12 +1,31 @@
-from typing import Union, IO, Optional, Iterable
+from typing import Any, Union
 import sys
 import io
 
 
-class BaseLexer(IO[str]):
+class _ClosedIO:
+    """Sentinel stream installed when a lexer is closed.
+
+    Any attribute access raises, so the per-call closed check on every
+    delegated I/O method becomes free.
+    """
+
+    __slots__ = []
+
+    def __getattr__(self, name: str) -> Any:
+        raise ValueError("I/O operation on closed file")
+
+
+_CLOSED_IO = _ClosedIO()
+
+
+class BaseLexer:
     """
     KoiLang lexer reading from stdin
-    Wraps sys.stdin instead of inheriting from IOBase
+
+    Wraps sys.stdin and delegates undefined attributes directly to the
+    underlying stream, so the lexer can be used anywhere an `IO[str]`
+    object is expected.
     """
 
     def __init__(self, *, encoding: str | None = None):
@@ -19,81 +38,23 @@ class BaseLexer(IO[str]):
     def close(self):
         """Close the lexer"""
         self._closed = True
+        self._io = _CLOSED_IO
 
     @property
     def closed(self) -> bool:
         """Check if the lexer is closed"""
         return self._closed
 
-    def fileno(self) -> int:
-        """Return the file descriptor"""
-        if self.closed:
-            raise ValueError("I/O operation on closed file")
-        return self._io.fileno()
-
-    def flush(self):
-        """Flush the stream"""
-        if self.closed:
-            raise ValueError("I/O operation on closed file")
-        self._io.flush()
-
-    def isatty(self) -> bool:
-        """Return whether this is an 'interactive' stream"""
-        if self.closed:
-            raise ValueError("I/O operation on closed file")
-        return self._io.isatty()
-
-    def read(self, size: int = -1) -> str:
-        """Read up to size characters from stream"""
-        if self.closed:
-            raise ValueError("I/O operation on closed file")
-        return self._io.read(size)
-
-    def readline(self, size: int = -1) -> str:
-        """Read a line from the stream"""
-        if self.closed:
-            raise ValueError("I/O operation on closed file")
-        return self._io.readline(size)
-
-    def readlines(self, hint: int = -1) -> list[str]:
-        """Read and return a list of lines from the stream"""
-        if self.closed:
-            raise ValueError("I/O operation on closed file")
-        return self._io.readlines(hint)
-
-    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
-        """Change stream position"""
-        if self.closed:
-            raise ValueError("I/O operation on closed file")
-        return self._io.seek(offset, whence)
-
-    def tell(self) -> int:
-        """Return current stream position"""
-        if self.closed:
-            raise ValueError("I/O operation on closed file")
-        return self._io.tell()
-
-    def writable(self) -> bool:
-        """Return whether the stream supports writing"""
-        return self._io.writable()
-
-    def write(self, s: str) -> int:
-        """Write string to stream"""
-        if self.closed:
-            raise ValueError("I/O operation on closed file")
-        return self._io.write(s)
-
-    def writelines(self, lines: Iterable[str]) -> None:
-        """Write a list of lines to stream"""
-        if self.closed:
-            raise ValueError("I/O operation on closed file")
-        self._io.writelines(lines)
+    def __getattr__(self, name: str) -> Any:
+        # Delegate I/O methods (read, readline, seek, write, ...) to the
+        # underlying stream; after close() this raises ValueError.
+        return getattr(self._io, name)
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        line = self.readline()
+        line = self._io.readline()
         if not line:
             raise StopIteration
         return line
@@ -121,14 +82,16 @@ class FileLexer(BaseLexer):
         self._filenameo = path
         self.encoding = encoding
         self.filename = path
-        # Wrap a file object as the underlying IO
-        self._io = open(path, 'r', encoding=self.encoding)
+        # Wrap a file object as the underlying IO; a large buffer lets the
+        # per-line reads of the parser loop hit memory instead of syscalls
+        self._io = open(path, 'r', encoding=self.encoding, buffering=1 << 20)
         self._closed = False
 
     def close(self):
         """Close the lexer and the underlying file"""
         if not self.closed:
             self._io.close()
+            self._io = _CLOSED_IO
             self._closed = True
 
     @property
@@ -149,13 +112,13 @@ class StringLexer(BaseLexer):
     def __init__(self, content: Union[str, bytes], **kwds):
         self.encoding = kwds.get('encoding', 'utf-8')
         self.filename = "<string>"
-        
+
         # Handle content
         if isinstance(content, bytes):
             self._content = content.decode(self.encoding)
         else:
             self._content = content
-        
+
         # Wrap a StringIO object as the underlying IO
         self._io = io.StringIO(self._content)
         self._closed = False
@@ -164,6 +127,7 @@ class StringLexer(BaseLexer):
         """Close the lexer"""
         if not self.closed:
             self._io.close()
+            self._io = _CLOSED_IO
             self._closed = True
 
     def __repr__(self):
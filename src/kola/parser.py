@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Callable, Final, Generic, Tuple, TypeVar
 from typing_extensions import Protocol, Self
 from .lexer import BaseLexer
@@ -14,6 +15,12 @@ T_CmdSet = TypeVar("T_CmdSet", bound=SupportGetCommand)
 T_Lexer = TypeVar("T_Lexer", bound=BaseLexer)
 
 
+@lru_cache(maxsize=32)
+def _config_for(threshold: int) -> ParserConfig:
+    """Get the shared parser config for a command threshold."""
+    return ParserConfig(command_threshold=threshold)
+
+
 class Parser(Generic[T_Lexer, T_CmdSet]):
     lexer: Final[T_Lexer]
     command_set: Final[T_CmdSet]
@@ -24,7 +31,7 @@ class Parser(Generic[T_Lexer, T_CmdSet]):
 
         # Determine command threshold from command_set if possible
         threshold = getattr(command_set.__class__, "__command_threshold__", 1)
-        config = ParserConfig(command_threshold=threshold)
+        config = _config_for(threshold)
 
         # CoreParser accepts IO[str] which BaseLexer implements
         self._core_parser = CoreParser(lexer, config=config)
@@ -35,12 +42,8 @@ class Parser(Generic[T_Lexer, T_CmdSet]):
     def __next__(self) -> Any:
         try:
             core_cmd: CoreCommand = next(self._core_parser)
-        except StopIteration:
-            raise StopIteration
         except KoiParseError as e:
             raise KoiLangSyntaxError(str(e)) from e
-        except Exception as e:
-            raise e
 
         # Resolve command name
         name = core_cmd.name
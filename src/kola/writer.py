@@ -1,12 +1,42 @@
 import os
 import io
+from functools import lru_cache
 from types import TracebackType
-from typing import Any, Type, Union, Optional
+from typing import Any, Iterable, Type, Union, Optional
 from typing_extensions import Protocol, runtime_checkable, Self
 
 from koilang.core import Writer as CoreWriter, Command as CoreCommand
 from koilang.model import WriterConfig, FormatterOptions
 
+# The CoreWriter API is fixed at import time; probe optional methods once
+# instead of wrapping every call in try/except AttributeError
+_CORE_WRITER_FLUSH = getattr(CoreWriter, "flush", None)
+
+
+@lru_cache(maxsize=64)
+def _config_for(indent: int, command_threshold: int) -> WriterConfig:
+    """Get the shared writer config for an indent width and command threshold."""
+    return WriterConfig(
+        global_options=FormatterOptions(indent=indent),
+        command_threshold=command_threshold,
+    )
+
+
+class _ClosedWriter:
+    """Sentinel core writer installed before init and after close.
+
+    Any attribute access raises, so the write methods need no per-call
+    None check; mirrors the `_ClosedIO` sentinel in the lexer module.
+    """
+
+    __slots__ = []
+
+    def __getattr__(self, name: str) -> Any:
+        raise ValueError("I/O operation on closed writer")
+
+
+_CLOSED_WRITER = _ClosedWriter()
+
 
 @runtime_checkable
 class WriterItemLike(Protocol):
@@ -14,106 +44,246 @@ class WriterItemLike(Protocol):
 
 
 class BaseWriterItem(object):
-    def __kola_write__(self, writer: "BaseWriter", level: int) -> None: ...
+    """Optional base class for writer items.
+
+    Subclasses define `__kola_write__(writer, level)`; the base carries no
+    default implementation, so `write` stays a single attribute lookup and
+    items that forget the hook fail with `TypeError` there.
+    """
+
+    __slots__ = []
+
+
+class _ListSink:
+    """Minimal binary sink backing `StringWriter`.
+
+    Appending chunks to a list and joining once in `getvalue` avoids the
+    geometric reallocation cost of incremental `io.BytesIO` writes.
+    """
+
+    __slots__ = ["_chunks", "_len", "closed"]
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._len = 0
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        size = len(data)
+        self._chunks.append(data)
+        self._len += size
+        return size
+
+    def flush(self) -> None:
+        pass
+
+    def writable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self.closed = True
+
+    def getvalue(self) -> bytes:
+        # The total length is tracked during writes, so the result is built
+        # in one allocation instead of join's length-summing pre-pass
+        result = bytearray(self._len)
+        offset = 0
+        for chunk in self._chunks:
+            end = offset + len(chunk)
+            result[offset:end] = chunk
+            offset = end
+        return bytes(result)
 
 
 class BaseWriter(object):
+    __slots__ = [
+        "_indent_val",
+        "_command_threshold",
+        "_writer",
+        "_io",
+        "_closed",
+        "_indent_level",
+        "_pending_indent_delta",
+    ]
+
     def __init__(self, indent: int = 4, command_threshold: int = 1) -> None:
         self._indent_val = indent
         self._command_threshold = command_threshold
-        self._writer: Optional[CoreWriter] = None
+        self._writer: CoreWriter = _CLOSED_WRITER
         self._io: Optional[io.IOBase] = None
         self._closed = False
+        self._indent_level = 0
+        self._pending_indent_delta = 0
 
     def _init_writer(self, py_file: Union[str, os.PathLike, io.IOBase]):
-        config = WriterConfig(
-            global_options=FormatterOptions(indent=self._indent_val),
-            command_threshold=self._command_threshold,
-        )
+        config = _config_for(self._indent_val, self._command_threshold)
         self._writer = CoreWriter(py_file, config=config)
-        if isinstance(py_file, io.IOBase):
+        if hasattr(py_file, "write"):
             self._io = py_file
 
     @property
     def indent(self) -> int:
-        if self._writer:
-            try:
-                return self._writer.get_indent()
-            except AttributeError:
-                pass
-        return 0
+        # Tracked Python-side; indent only changes via inc_indent/dec_indent,
+        # so no FFI round-trip to CoreWriter.get_indent() is needed
+        return self._indent_level
 
     def raw_write(self, text: str) -> None:
-        # CoreWriter doesn't expose raw write easily, but we can write it to the IO if we have it
+        # CoreWriter holds no buffer of its own on the Rust side and writes
+        # straight through this same file object, so writing here keeps raw
+        # output ordered with command output in one coalesced pipeline
         if self._io:
-            self._io.write(text)
-        elif self._writer:
-            # Fallback for when we don't have direct access to IO?
-            # Actually CoreWriter usually has the IO.
-            pass
+            self._io.write(text.encode("utf-8"))
+
+    def flush(self) -> None:
+        """Flush buffered output to the underlying stream.
+
+        This is an explicit barrier only; the write methods never flush on
+        their own, so batching stays intact.
+        """
+        if _CORE_WRITER_FLUSH is not None:
+            _CORE_WRITER_FLUSH(self._writer)
+        if self._io is not None:
+            self._io.flush()
 
     def close(self) -> None:
-        if not self._closed:
-            if self._writer:
-                try:
-                    self._writer.close()
-                except AttributeError:
-                    pass
-                self._writer = None
-            if self._io:
-                self._io.close()
-                self._io = None
-            self._closed = True
+        if self._closed:
+            return
+        # Mark closed and release both references up front so a failing
+        # close() cannot be retried on half-released state
+        self._closed = True
+        writer, raw_io = self._writer, self._io
+        self._writer = _CLOSED_WRITER
+        self._io = None
+        if writer is not _CLOSED_WRITER:
+            writer.close()
+        if raw_io is not None:
+            raw_io.close()
 
     def inc_indent(self) -> None:
-        if self._writer:
-            self._writer.inc_indent()
+        # Indent changes are tracked Python-side and pushed to CoreWriter in
+        # one batched call right before the next write; paired inc/dec with
+        # no write in between never crosses the FFI at all
+        self._indent_level += 1
+        self._pending_indent_delta += 1
 
     def dec_indent(self) -> None:
-        if self._writer:
-            self._writer.dec_indent()
+        if self._indent_level:
+            self._indent_level -= 1
+            self._pending_indent_delta -= 1
+
+    def _sync_indent(self) -> None:
+        delta = self._pending_indent_delta
+        self._pending_indent_delta = 0
+        if delta:
+            self._writer.adjust_indent(delta)
 
     def newline(self, concat_prev: bool = False) -> None:
-        if self._writer:
-            self._writer.newline()
+        if self._pending_indent_delta:
+            self._sync_indent()
+        self._writer.newline()
 
     def write_text(self, text: str) -> None:
-        if self._writer:
-            self._writer.write_command(CoreCommand.new_text(text))
+        if not text:
+            return
+        if self._pending_indent_delta:
+            self._sync_indent()
+        self._writer.write_command(CoreCommand.new_text(text))
 
     def write_annotation(self, annotation: str) -> None:
-        if self._writer:
-            self._writer.write_command(CoreCommand.new_annotation(annotation))
-
-    def write_command(self, __name: Union[str, int], *args: Any, **kwds: Any) -> None:
-        if not self._writer:
+        if not annotation:
             return
+        if self._pending_indent_delta:
+            self._sync_indent()
+        self._writer.write_command(CoreCommand.new_annotation(annotation))
 
+    def write_command(self, __name: Union[str, int], *args: Any, **kwds: Any) -> None:
         if isinstance(__name, int):
-            # Number command
-            params = []
-            for arg in args:
-                params.append(arg)
-            for k, v in kwds.items():
-                params.append((k, v))
-            cmd = CoreCommand.new_number(__name, params)
+            self.write_number_command(__name, *args, **kwds)
+        else:
+            self.write_named_command(__name, *args, **kwds)
+
+    def write_named_command(self, __name: str, *args: Any, **kwds: Any) -> None:
+        """Write a command with a string name, skipping the name-type check.
+
+        Call sites that know the name type statically can use this (or
+        `write_number_command`) instead of the `write_command` dispatcher.
+        """
+        if self._pending_indent_delta:
+            self._sync_indent()
+        # Most call sites pass positional args only; CoreCommand accepts the
+        # args tuple as-is, so skip materializing a list for that case
+        if not kwds:
+            params: Any = args
         else:
-            params = []
-            for arg in args:
-                params.append(arg)
-            for k, v in kwds.items():
-                params.append((k, v))
-            cmd = CoreCommand(__name, params)
+            params = [*args, *kwds.items()]
+        self._writer.write_command(CoreCommand(__name, params))
 
-        self._writer.write_command(cmd)
+    def write_number_command(self, __value: int, *args: Any, **kwds: Any) -> None:
+        """Write a number command, skipping the name-type check."""
+        if self._pending_indent_delta:
+            self._sync_indent()
+        if not kwds:
+            params: Any = args
+        else:
+            params = [*args, *kwds.items()]
+        self._writer.write_command(CoreCommand.new_number(__value, params))
+
+    def write_commands(
+        self, __commands: Iterable[Union[CoreCommand, tuple, str]]
+    ) -> None:
+        """Write a batch of commands in one pass.
+
+        Items may be prebuilt `Command` objects, `(name, *params)` tuples --
+        where the params follow the same rules as `write_command` arguments
+        and keyword parameters are given as `(key, value)` pairs -- or plain
+        strings, which are written as text like in
+        `write_commands_from_items`.
+        """
+        if self._pending_indent_delta:
+            self._sync_indent()
+        writer = self._writer
+        new = CoreCommand
+        new_number = CoreCommand.new_number
+        new_text = CoreCommand.new_text
+        write = writer.write_command
+        for item in __commands:
+            if isinstance(item, CoreCommand):
+                write(item)
+            elif isinstance(item, str):
+                write(new_text(item))
+            elif isinstance(item, tuple):
+                name, *params = item
+                if isinstance(name, int):
+                    write(new_number(name, params))
+                else:
+                    write(new(name, params))
+            else:
+                raise TypeError(f"Expected Command, str or tuple, got {type(item)}")
+
+    def write_commands_from_items(
+        self, __items: Iterable[Union[str, CoreCommand, WriterItemLike]]
+    ) -> None:
+        """Write a batch of mixed items with the loop run on the Rust side.
+
+        `Command` objects and plain strings (written as text) are handled
+        entirely in Rust; any other item is called back through its
+        `__kola_write__` method, as in `write`.
+        """
+        if self._pending_indent_delta:
+            self._sync_indent()
+        self._writer.write_items(__items, self, self._indent_level)
 
     def write(self, command: Union[str, WriterItemLike]) -> None:
         if isinstance(command, str):
             self.write_text(command)
-        elif isinstance(command, WriterItemLike):
-            command.__kola_write__(self, self.indent)
-        else:
-            raise TypeError(f"Expected str or WriterItemLike, got {type(command)}")
+            return
+        # Duck-type instead of the runtime-checkable Protocol: a Protocol
+        # isinstance check walks the mro and probes attributes on every call
+        kola_write = getattr(command, "__kola_write__", None)
+        if kola_write is not None:
+            kola_write(self, self.indent)
+            return
+        raise TypeError(f"Expected str or WriterItemLike, got {type(command)}")
 
     @property
     def closed(self) -> bool:
@@ -132,6 +302,8 @@ class BaseWriter(object):
 
 
 class FileWriter(BaseWriter):
+    __slots__ = ["path", "encoding"]
+
     def __init__(
         self,
         __path: Union[str, bytes, os.PathLike],
@@ -142,17 +314,22 @@ class FileWriter(BaseWriter):
         super().__init__(indent, command_threshold)
         self.path = __path
         self.encoding = encoding
-        # CoreWriter works best with binary file objects from Python
-        self._io = open(__path, "wb")
+        # CoreWriter works best with binary file objects from Python; a
+        # 128 KiB buffer coalesces its many small writes into few syscalls
+        self._io = open(__path, "wb", buffering=1 << 17)
         self._init_writer(self._io)
 
 
 class StringWriter(BaseWriter):
+    __slots__ = ["_buffer"]
+
     def __init__(self, indent: int = 4, command_threshold: int = 1) -> None:
         super().__init__(indent, command_threshold)
-        self._buffer = io.BytesIO()
+        self._buffer = _ListSink()
         self._init_writer(self._buffer)
 
     def getvalue(self) -> str:
-        # CoreWriter doesn't have a flush() method, it writes directly to IO
+        # The sink keeps its chunks after close(), so this stays valid in the
+        # common `with StringWriter() as w: ...` then `w.getvalue()` pattern
+        # (a closed BytesIO would raise ValueError here instead)
         return self._buffer.getvalue().decode("utf-8")
@@ -19,13 +19,18 @@ from koilang.core import (
 from koilang.model import ParserConfig, FormatterOptions
 
 
-@pytest.fixture
-def ktxt_file() -> IO[str]:
-    content = """## Sample KoiLang file
+# Shared once at import; Parser requires text input (readline() must return
+# str), so the fixture wraps the same string rather than re-building it or
+# switching to a bytes buffer
+KTXT_CONTENT = """## Sample KoiLang file
     Hello world!
     #test 1 abc a(1) 3.14 b(2, "3") c(d: 4)
     """
-    return io.StringIO(content)
+
+
+@pytest.fixture
+def ktxt_file() -> IO[str]:
+    return io.StringIO(KTXT_CONTENT)
 
 
 @pytest.fixture
@@ -106,6 +111,48 @@ def test_writer_explicit_close(tmp_path):
     assert "#manual 123" in content
 
 
+def test_write_items():
+    output = io.BytesIO()
+    writer = Writer(output)
+
+    class Item:
+        def __kola_write__(self, wrapper, level):
+            wrapper.write_command(Command("from_item", [level]))
+
+    # Command and str items stay on the Rust fast path; other items are
+    # called back through __kola_write__ with the wrapper and level
+    writer.write_items([Command("cmd", [1]), "Hello world!", Item()], writer, 2)
+    writer.close()
+
+    result = output.getvalue().decode("utf-8")
+    assert "#cmd 1" in result
+    assert "Hello world!" in result
+    assert "#from_item 2" in result
+
+
+def test_write_items_default_wrapper():
+    output = io.BytesIO()
+    writer = Writer(output)
+
+    seen = []
+
+    class Item:
+        def __kola_write__(self, wrapper, level):
+            seen.append((wrapper, level))
+
+    writer.write_items([Item()])
+    writer.close()
+
+    # Without an explicit wrapper the Writer itself is passed through
+    assert seen == [(writer, 0)]
+
+
+def test_write_items_rejects_unknown():
+    writer = Writer(io.BytesIO())
+    with pytest.raises(TypeError):
+        writer.write_items([object()])
+
+
 def test_write_command_with_options():
     output = io.BytesIO()
     writer = Writer(output)
@@ -15,7 +15,8 @@ from kola.klvm.decorator import (
 from kola.klvm.writer import KoiLangWriter
 from kola.lexer import StringLexer
 from kola.parser import Parser
-from kola.writer import BaseWriter
+from kola.writer import BaseWriter, StringWriter
+from koilang.core import Command
 
 
 class CommandSetTest(CommandSet):
@@ -189,6 +190,38 @@ class TestKoiLang(TestCase):
         string = "#version 10\n#1\n    Hello world!\n#2\n    ???\n\n    #enter\n"
         self.assertEqual(text, string)
 
+    def test_writer_commands(self) -> None:
+        with StringWriter() as wr:
+            wr.write_commands(
+                [
+                    Command("cmd", [1]),
+                    ("set", 2, ("key", "value")),
+                    (3, "abc"),
+                    "Hello",
+                ]
+            )
+            text = wr.getvalue()
+        self.assertEqual(text, "#cmd 1\n#set 2 key(value)\n#3 abc\nHello\n")
+
+        with StringWriter() as wr:
+            with self.assertRaises(TypeError):
+                wr.write_commands([object()])
+
+    def test_writer_closed(self) -> None:
+        wr = StringWriter()
+        wr.write_command("cmd", 1)
+        wr.close()
+        self.assertTrue(wr.closed)
+        # The buffered value stays readable after close
+        self.assertEqual(wr.getvalue(), "#cmd 1\n")
+        # Writes on a closed writer raise instead of silently doing nothing
+        with self.assertRaises(ValueError):
+            wr.write_command("cmd")
+        with self.assertRaises(ValueError):
+            wr.write_text("text")
+        with self.assertRaises(ValueError):
+            wr.newline()
+
 
 if __name__ == "__main__":
     for i in TestKoiLang.__dict__:
@@ -1,5 +1,7 @@
 import io
 from typing import Any, Callable
+
+import pytest
 from koilang.runtime import Executor, Runtime, env_enter, env_exit
 from koilang.core import Command
 from koilang.runtime.context import current_command
@@ -97,6 +99,32 @@ def test_middleware() -> None:
     assert log == ["before cmd", "after cmd"]
 
 
+def test_middleware_retry() -> None:
+    log = []
+
+    def retry_middleware(
+        runtime: Runtime, cmd: Command, next_handler: Callable[[], Any]
+    ) -> Any:
+        next_handler()
+        return next_handler()
+
+    def logger_middleware(
+        runtime: Runtime, cmd: Command, next_handler: Callable[[], Any]
+    ) -> Any:
+        log.append("log")
+        ret = next_handler()
+        log.append("hit")
+        return ret
+
+    runtime = Runtime(
+        TestCommandSet(), middleware=[retry_middleware, logger_middleware]
+    )
+    runtime.execute(io.StringIO("#cmd\n"))
+
+    # Each retry must replay the downstream middleware, not just the command
+    assert log == ["log", "hit", "log", "hit"]
+
+
 def test_dependency_command() -> None:
     class CmdEnv:
         def do_check(self) -> None:
@@ -109,6 +137,23 @@ def test_dependency_command() -> None:
     assert env.last_cmd_name == "check"
 
 
+def test_runtime_without_context() -> None:
+    class CmdEnv:
+        def do_check(self) -> None:
+            # The contextvars are never set, so the documented fallback is
+            # the runtime's current_command attribute
+            with pytest.raises((LookupError, RuntimeError)):
+                current_command()
+            self.seen = runtime.current_command
+
+    env = CmdEnv()
+    runtime = Runtime(env, use_context=False)
+    runtime.execute(io.StringIO("#check"))
+    assert env.seen is not None
+    assert env.seen.name == "check"
+    assert runtime.current_command is None
+
+
 def test_positional_only() -> None:
     class PosEnv:
         def do_p(self, x: int, /, y: int) -> None: